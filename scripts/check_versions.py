@@ -4,17 +4,63 @@ Dependency Version Checker
 
 This script checks the latest versions of iOS and Android dependencies
 by querying GitHub repositories and outputs the results to docs/data.json.
+
+All dependency checks run concurrently on a single asyncio event loop so
+the total wall time is bounded by the slowest GitHub round-trip rather
+than the sum of them.
 """
 
+import asyncio
 import json
 import os
 import sys
+from collections import Counter
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+import random
 import re
-import time # For potential retries or delays
+import time # For retry backoff and cache timestamps
+
+import httpx
+
+# orjson (Rust-backed) parses/serializes JSON several times faster than the
+# stdlib and accepts bytes directly, skipping the intermediate UTF-8 decode.
+# Fall back to stdlib json so the script still runs without it.
+try:
+    import orjson
+
+    def _json_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data: Any) -> Any:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# Optional semantic-version comparison. Imported once here instead of inside
+# determine_status, which used to pay an import lookup (and a caught
+# ImportError without the library) on every call.
+try:
+    from packaging.version import InvalidVersion as _InvalidVersion
+    from packaging.version import parse as _parse_version
+except ImportError:
+    _parse_version = None
+    _InvalidVersion = ValueError
 
 # --- Configuration ---
 # Set to True to enable verbose debugging output
@@ -23,67 +69,188 @@ DEBUG_MODE = os.environ.get('DEBUG_CHECK_VERSIONS', 'False').lower() == 'true'
 # API request timeout in seconds
 REQUEST_TIMEOUT = 15
 
+# Pins whose 'current' value names one of these are treated as tracking a
+# branch rather than pinned to a version tag. A module-level frozenset so
+# the membership test is a hash probe instead of rebuilding a list per
+# dependency. # Add more if needed
+TRACKING_BRANCH_NAMES = frozenset({'master', 'main', 'develop', 'dev', 'mainline'})
+
+# Attempts per request before giving up (retries cover transient 5xx/429s)
+MAX_REQUEST_ATTEMPTS = 3
+
+# Cap on /tags pages walked per repository. Repos with non-PEP440 tag
+# schemes (or pins ahead of every published tag) never trigger the
+# early exit, and without a cap they would burn one API call per 100
+# tags on every cold run.
+MAX_TAG_PAGES = 3
+
+# On-disk response cache: conditional requests (If-None-Match) make 304
+# responses free against the rate limit, and entries fresher than the TTL
+# are reused without any HTTP call at all. Bypass with --no-cache.
+CACHE_FILE_PATH = os.path.join('docs', '.gh_cache.json')
+CACHE_TTL_SECONDS = 3600
+CACHE_ENABLED = '--no-cache' not in sys.argv
+
+# In-memory view of the cache, loaded once per run and persisted by main().
+# Entries are keyed by API URL: {etag, body, fetched_at}.
+_response_cache: Dict[str, Dict[str, Any]] = {}
+
+# Within-run memo of successful responses keyed by URL, so asking for the
+# same URL twice in one run (e.g. the master→main branch fallback across
+# deps) costs a dict lookup instead of a round-trip. Unlike the disk cache
+# it needs no revalidation because nothing changes mid-run.
+_response_memo: Dict[str, Tuple[Any, Optional[str]]] = {}
+
+
+def load_response_cache():
+    """Load the on-disk response cache, tolerating a missing or corrupt file."""
+    global _response_cache
+    if not CACHE_ENABLED:
+        log_debug("Response cache disabled via --no-cache.")
+        return
+    try:
+        with open(CACHE_FILE_PATH, 'rb') as f:
+            _response_cache = _json_loads(f.read())
+        log_debug(f"Loaded {len(_response_cache)} cached responses from {CACHE_FILE_PATH}")
+    except FileNotFoundError:
+        log_debug(f"No response cache found at {CACHE_FILE_PATH} (cold run).")
+    except (ValueError, OSError) as e:
+        print(f"WARN: Could not read response cache {CACHE_FILE_PATH}: {e}. Starting cold.")
+        _response_cache = {}
+
+
+def save_response_cache():
+    """Persist the response cache so the next run can send conditional requests."""
+    if not CACHE_ENABLED:
+        return
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE_PATH), exist_ok=True)
+        with open(CACHE_FILE_PATH, 'wb') as f:
+            f.write(_json_dumps(_response_cache))
+        log_debug(f"Persisted {len(_response_cache)} cached responses to {CACHE_FILE_PATH}")
+    except OSError as e:
+        print(f"WARN: Could not write response cache {CACHE_FILE_PATH}: {e}")
+
 # --- Dependencies ---
-# Consider moving this to a separate JSON file (e.g., input_dependencies.json) for easier management
-IOS_DEPENDENCIES = [
-    {
-        "name": "AlertToast",
-        "url": "https://github.com/elai950/AlertToast",
-        "current": "1.3.9"
-    },
-    {
-        "name": "Firebase",
-        "url": "https://github.com/firebase/firebase-ios-sdk", # Removed .git
-        "current": "10.0.0"
-    },
-    {
-        "name": "Lottie",
-        "url": "https://github.com/airbnb/lottie-ios",
-        "current": "4.0.0"
-    },
-    {
-        "name": "Mantis",
-        "url": "https://github.com/guoyingtao/Mantis",
-        "current": "2.8.0"
-    },
-    {
-        "name": "Reachability",
-        "url": "https://github.com/ashleymills/Reachability.swift",
-        "current": "master"
-    },
-    {
-        "name": "SDWebImageSwiftUI",
-        "url": "https://github.com/SDWebImage/SDWebImageSwiftUI",
-        "current": "3.1.3"
-    },
-    {
-        "name": "GoogleMobileAds",
-        "url": "https://github.com/googleads/swift-package-manager-google-mobile-ads",
-        "current": "11.0.0"
-    },
-    {
-        "name": "GoogleUserMessagingPlatform",
-        "url": "https://github.com/googleads/swift-package-manager-user-messaging", # Removed .git
-        "current": "2.1.0"
-    },
-    {
-        "name": "swiftui-introspect",
-        "url": "https://github.com/siteline/SwiftUI-Introspect", # Removed .git
-        "current": "0.2.3"
-    },
-    {
-        "name": "TOCropViewController",
-        "url": "https://github.com/TimOliver/TOCropViewController",
-        "current": "2.6.1"
-    }
-]
+# The list lives in dependencies.json at the repo root so entries can be
+# added/removed without touching Python, and CI can cache on the file's hash.
+DEPENDENCIES_FILE = Path(__file__).resolve().parent.parent / 'dependencies.json'
+
+
+def load_dependencies() -> List[Dict[str, str]]:
+    """Load the dependency list from dependencies.json."""
+    try:
+        return _json_loads(DEPENDENCIES_FILE.read_bytes())
+    except FileNotFoundError:
+        print(f"❌ ERROR: Dependency list not found at {DEPENDENCIES_FILE}")
+        sys.exit(1)
+    except (ValueError, OSError) as e:
+        print(f"❌ ERROR: Could not read {DEPENDENCIES_FILE}: {e}")
+        sys.exit(1)
+
+
+IOS_DEPENDENCIES = load_dependencies()
+
+# If the quota would only reset further away than this, give up early
+# instead of sleeping through most of the hour.
+MAX_RATE_LIMIT_WAIT_SECONDS = 300
+
+# Stop firing requests once the remaining quota drops below this.
+RATE_LIMIT_FLOOR = 5
+
+# Cap on in-flight API requests. GitHub enforces a *secondary* rate limit on
+# concurrent requests (~10 per authenticated user) independent of the hourly
+# quota, so an unbounded gather would trip 403s even with quota to spare.
+GH_CONCURRENCY = int(os.environ.get('GH_CONCURRENCY', '8'))
+_request_semaphore = asyncio.Semaphore(GH_CONCURRENCY)
+
 
 # --- Helper Functions ---
 
+# Log lines produced during the concurrent fan-out are buffered and written
+# with a single syscall afterwards, instead of one locked/flushed print per
+# message (they would interleave arbitrarily anyway).
+_log_lines: List[str] = []
+
+
+def _log(message: str):
+    """Buffer a log line for a single batched write via flush_log()."""
+    _log_lines.append(message)
+
+
+def flush_log():
+    """Emit all buffered log lines in one stdout write."""
+    if _log_lines:
+        sys.stdout.write("\n".join(_log_lines) + "\n")
+        sys.stdout.flush()
+        _log_lines.clear()
+
+
 def log_debug(message: str):
-    """Prints a message only if DEBUG_MODE is True."""
+    """Buffers a message only if DEBUG_MODE is True."""
     if DEBUG_MODE:
-        print(f"DEBUG: {message}")
+        _log(f"DEBUG: {message}")
+
+
+class RateLimitError(Exception):
+    """Raised when the GitHub API quota is exhausted and won't reset soon."""
+
+
+class RateLimiter:
+    """
+    Tracks GitHub's X-RateLimit-Remaining / X-RateLimit-Reset headers across
+    concurrent requests and throttles before the quota is burst. With many
+    requests in flight, reacting only to 403s would waste doomed calls.
+    """
+
+    def __init__(self):
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self.lock = asyncio.Lock()
+
+    def update_from_headers(self, headers: Any):
+        """Record the latest quota state from a response's headers."""
+        try:
+            remaining = headers.get('X-RateLimit-Remaining')
+            reset_at = headers.get('X-RateLimit-Reset')
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset_at is not None:
+                self.reset_at = float(reset_at)
+            log_debug(f"Rate limit state: remaining={self.remaining}, reset_at={self.reset_at}")
+        except (TypeError, ValueError) as e:
+            log_debug(f"Could not parse rate-limit headers: {e}")
+
+    async def throttle(self):
+        """
+        Wait (or bail out) if the remaining quota is below the floor.
+        Called before every API request; the lock ensures only one coroutine
+        evaluates/sleeps on the shared state at a time.
+        """
+        async with self.lock:
+            if self.remaining is None or self.remaining >= RATE_LIMIT_FLOOR:
+                return
+            wait_seconds = max(0.0, self.reset_at - time.time())
+            if wait_seconds > MAX_RATE_LIMIT_WAIT_SECONDS:
+                raise RateLimitError(
+                    f"GitHub API quota nearly exhausted ({self.remaining} left); "
+                    f"resets in {wait_seconds:.0f}s. Aborting instead of waiting."
+                )
+            if wait_seconds > 0:
+                _log(f"⏳ Rate limit low ({self.remaining} left). Sleeping {wait_seconds:.0f}s until reset...")
+                await asyncio.sleep(wait_seconds)
+            self.remaining = None # Re-learn from the next response.
+
+
+_rate_limiter = RateLimiter()
+
+# Regex to capture owner and repo from various GitHub URL formats,
+# compiled once at import time rather than per call.
+_GH_URL_RE = re.compile(r'^(?:https|git)://github\.com/([^/]+)/([^/]+?)(?:\.git)?$')
+
+# Extracts the rel="next" URL from a Link response header for pagination.
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
 
 def parse_github_url(url: str) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -95,84 +262,188 @@ def parse_github_url(url: str) -> Tuple[Optional[str], Optional[str]]:
     # Remove .git suffix if present
     if url.endswith('.git'):
         url = url[:-4]
-    
+
     # Remove trailing slash if present
     url = url.rstrip('/')
 
-    # Regex to capture owner and repo from various GitHub URL formats
-    pattern = r'^(?:https|git)://github\.com/([^/]+)/([^/]+?)(?:\.git)?$'
-    match = re.match(pattern, url)
-    
+    match = _GH_URL_RE.match(url)
+
     if match:
         owner = match.group(1)
         repo = match.group(2)
         log_debug(f"Parsed URL '{url}' -> Owner: '{owner}', Repo: '{repo}'")
         return owner, repo
-    
+
     log_debug(f"Failed to parse GitHub URL: '{url}'")
     return None, None
 
 
-def make_github_request(url: str) -> Optional[Dict[str, Any]]:
+def _parse_static_github_url(url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Fast-path parser for the two URL shapes dependencies.json actually uses
+    (https://github.com/<owner>/<repo> with or without .git). Plain string
+    splitting, no regex engine; anything odd falls back to parse_github_url.
+    """
+    trimmed = url.removesuffix('.git').rstrip('/')
+    if trimmed.startswith(('https://github.com/', 'git://github.com/')):
+        parts = trimmed.rsplit('/', 2)
+        if len(parts) == 3 and parts[1] and parts[2] and parts[0].endswith('github.com'):
+            return parts[1], parts[2]
+    return parse_github_url(url)
+
+
+# The config is static, so resolve (owner, repo) for every entry once at
+# import time instead of re-parsing URLs in the per-dependency hot path.
+for _dep in IOS_DEPENDENCIES:
+    _dep['_owner'], _dep['_repo'] = _parse_static_github_url(_dep['url'])
+del _dep
+
+
+async def make_github_request(session: httpx.AsyncClient, url: str, want_link: bool = False) -> Any:
     """
     Make a request to GitHub API with proper headers and error handling.
+
+    Returns the decoded JSON body, or None on failure. With want_link=True,
+    returns a (body, next_url) tuple where next_url is the rel="next" URL
+    from the Link header (None when there is no further page).
     """
+    def _result(data: Any, link_header: Optional[str]) -> Any:
+        if not want_link:
+            return data
+        next_match = _LINK_NEXT_RE.search(link_header) if link_header else None
+        return data, (next_match.group(1) if next_match else None)
+
     headers = {
         'User-Agent': 'Dependency-Version-Checker/1.0 (Python Script)',
         'Accept': 'application/vnd.github.v3+json'
     }
-    
+
     github_token = os.environ.get('GITHUB_TOKEN')
     if github_token:
         headers['Authorization'] = f'token {github_token}'
         log_debug(f"Using GITHUB_TOKEN for request to {url}")
     else:
         log_debug(f"No GITHUB_TOKEN found for request to {url}. Rate limits will be lower.")
-    
+
+    memoized = _response_memo.get(url)
+    if memoized is not None:
+        log_debug(f"In-run memo hit for {url}.")
+        return _result(*memoized)
+
+    cached_entry = _response_cache.get(url) if CACHE_ENABLED else None
+    if cached_entry:
+        age = time.time() - cached_entry.get('fetched_at', 0)
+        if age < CACHE_TTL_SECONDS:
+            log_debug(f"Cache hit for {url} (age {age:.0f}s < TTL {CACHE_TTL_SECONDS}s), skipping request.")
+            data = _json_loads(cached_entry['body'])
+            _response_memo[url] = (data, cached_entry.get('link'))
+            return _result(data, cached_entry.get('link'))
+        if cached_entry.get('etag'):
+            headers['If-None-Match'] = cached_entry['etag']
+            log_debug(f"Sending conditional request for {url} with ETag {cached_entry['etag']}")
+        if cached_entry.get('last_modified'):
+            # Some endpoints only emit Last-Modified; sending both validators
+            # maximises the chance of a free 304.
+            headers['If-Modified-Since'] = cached_entry['last_modified']
+            log_debug(f"Sending conditional request for {url} with Last-Modified {cached_entry['last_modified']}")
+
     log_debug(f"Making GET request to: {url} with headers: {headers if DEBUG_MODE else '...'}")
 
     try:
-        request = Request(url, headers=headers)
-        with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
-            response_body = response.read().decode('utf-8')
-            log_debug(f"Response status {response.status} for {url}. Body (first 200 chars): {response_body[:200]}")
-            
-            if response.status == 200:
-                return json.loads(response_body)
-            else:
-                print(f"WARN: GitHub API returned HTTP {response.status} for {url}. Body: {response_body}")
-                return None
-    except HTTPError as e:
-        error_body = ""
-        try:
-            error_body = e.read().decode('utf-8')
-        except Exception:
-            pass # Ignore if can't read body
-        print(f"ERROR: HTTP Error {e.code} for {url}: {e.reason}. Response body: {error_body}")
-        if e.code == 403 and "rate limit exceeded" in error_body.lower():
-            print("ERROR: GitHub API rate limit exceeded. Please use a GITHUB_TOKEN or wait.")
-        elif e.code == 404:
-            print(f"INFO: Resource not found at {url} (404). This might be expected (e.g., no /releases/latest).")
+        response = None
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            await _rate_limiter.throttle()
+            async with _request_semaphore:
+                response = await session.get(url, headers=headers)
+            _rate_limiter.update_from_headers(response.headers)
+
+            # Transient server errors and secondary-rate-limit 403s (which
+            # carry Retry-After) are worth retrying with backoff + jitter
+            # instead of failing the dependency for the whole run.
+            status = response.status_code
+            retryable = status in (429, 500, 502, 503, 504) or (status == 403 and 'Retry-After' in response.headers)
+            if not retryable or attempt == MAX_REQUEST_ATTEMPTS - 1:
+                break
+            try:
+                delay = float(response.headers.get('Retry-After', 2 ** attempt))
+            except ValueError:
+                delay = float(2 ** attempt)
+            delay += random.uniform(0, 1)
+            log_debug(f"HTTP {status} for {url} (attempt {attempt + 1}/{MAX_REQUEST_ATTEMPTS}), retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+        raw_body = response.content
+        log_debug(f"Response status {response.status_code} for {url}. Body (first 200 bytes): {raw_body[:200]!r}")
+
+        if response.status_code == 304 and cached_entry:
+            log_debug(f"304 Not Modified for {url}, reusing cached body.")
+            cached_entry['fetched_at'] = time.time()
+            data = _json_loads(cached_entry['body'])
+            _response_memo[url] = (data, cached_entry.get('link'))
+            return _result(data, cached_entry.get('link'))
+
+        if response.status_code == 200:
+            if CACHE_ENABLED:
+                _response_cache[url] = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'body': raw_body.decode('utf-8'),
+                    'link': response.headers.get('Link'),
+                    'fetched_at': time.time()
+                }
+            data = _json_loads(raw_body)
+            _response_memo[url] = (data, response.headers.get('Link'))
+            return _result(data, response.headers.get('Link'))
+
+        # Error paths below need the body as text.
+        response_body = raw_body.decode('utf-8', errors='replace')
+        if response.status_code == 403 and "rate limit exceeded" in response_body.lower():
+            _log(f"ERROR: GitHub API rate limit exceeded for {url}. Please use a GITHUB_TOKEN or wait.")
+        elif response.status_code == 404:
+            _log(f"INFO: Resource not found at {url} (404). This might be expected (e.g., no /releases/latest).")
+        else:
+            _log(f"WARN: GitHub API returned HTTP {response.status_code} for {url}. Body: {response_body[:500]}")
         return None
-    except URLError as e:
-        print(f"ERROR: URL Error for {url}: {e.reason}")
+    except RateLimitError:
+        raise # Let the run abort rather than reporting a per-dep error.
+    except httpx.TimeoutException:
+        _log(f"ERROR: Request to {url} timed out after {REQUEST_TIMEOUT}s")
         return None
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Failed to decode JSON response from {url}: {e}")
+    except httpx.HTTPError as e:
+        _log(f"ERROR: Client error for {url}: {type(e).__name__} - {e}")
+        return None
+    except ValueError as e: # Covers both json and orjson decode errors
+        _log(f"ERROR: Failed to decode JSON response from {url}: {e}")
         return None
     except Exception as e:
-        print(f"ERROR: Unexpected error during request to {url}: {type(e).__name__} - {e}")
+        _log(f"ERROR: Unexpected error during request to {url}: {type(e).__name__} - {e}")
         return None
 
 
-def get_latest_release(owner: str, repo: str) -> Optional[str]:
+async def warm_up_rate_limit(session: httpx.AsyncClient):
+    """
+    Prime the RateLimiter from /rate_limit (which does not count against the
+    quota) so the run can decide up front whether it is worth starting.
+    """
+    headers = {'User-Agent': 'Dependency-Version-Checker/1.0 (Python Script)'}
+    github_token = os.environ.get('GITHUB_TOKEN')
+    if github_token:
+        headers['Authorization'] = f'token {github_token}'
+    try:
+        response = await session.get("https://api.github.com/rate_limit", headers=headers)
+        _rate_limiter.update_from_headers(response.headers)
+    except httpx.HTTPError as e:
+        log_debug(f"Could not warm up rate-limit state: {type(e).__name__} - {e}")
+
+
+async def get_latest_release(session: httpx.AsyncClient, owner: str, repo: str) -> Optional[str]:
     """
     Get the latest release tag_name for a GitHub repository.
     """
     url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
     log_debug(f"Fetching latest release from: {url}")
-    data = make_github_request(url)
-    
+    data = await make_github_request(session, url)
+
     if data and 'tag_name' in data:
         tag_name = data['tag_name']
         log_debug(f"Latest release tag for {owner}/{repo}: {tag_name}")
@@ -181,29 +452,80 @@ def get_latest_release(owner: str, repo: str) -> Optional[str]:
     return None
 
 
-def get_latest_tag(owner: str, repo: str) -> Optional[str]:
+async def get_latest_tag(session: httpx.AsyncClient, owner: str, repo: str, current_version: Optional[str] = None) -> Optional[str]:
     """
     Get the latest tag name for a GitHub repository.
-    This often requires sorting tags semantically if multiple are returned.
-    For simplicity, this implementation takes the first tag, assuming GitHub API returns them sorted by date (often true).
-    A more robust solution would involve semantic version parsing and sorting.
+
+    The API does not guarantee any particular tag ordering, so pages are
+    walked via the Link header (100 tags per page) and the semantically
+    highest tag wins. Pagination stops early once a tag at or above the
+    current version has been seen — well-maintained repos resolve on the
+    first page — and never goes past MAX_TAG_PAGES. Without the `packaging`
+    library, or when no tag parses as a version at all, this degrades to
+    the old first-tag-returned behaviour.
     """
-    url = f"https://api.github.com/repos/{owner}/{repo}/tags"
-    log_debug(f"Fetching tags from: {url}")
-    data = make_github_request(url)
-    
-    if data and isinstance(data, list) and len(data) > 0:
-        # Assuming the first tag in the list is the most recent one published.
-        # GitHub API usually returns tags in reverse chronological order (newest first).
-        tag_name = data[0].get('name')
-        if tag_name:
-            log_debug(f"Latest tag for {owner}/{repo} (from list): {tag_name}")
-            return tag_name
+    url: Optional[str] = f"https://api.github.com/repos/{owner}/{repo}/tags?per_page=100"
+    best_parsed = None
+    best_name: Optional[str] = None
+    first_name: Optional[str] = None
+
+    current_parsed = None
+    if _parse_version is not None and current_version:
+        try:
+            current_parsed = _parse_version(current_version.lstrip('vV'))
+        except _InvalidVersion:
+            pass
+
+    for _page_number in range(MAX_TAG_PAGES):
+        if not url:
+            break
+        log_debug(f"Fetching tags page: {url}")
+        page = await make_github_request(session, url, want_link=True)
+        if not page:
+            break
+        data, next_url = page
+        if not data or not isinstance(data, list):
+            break
+
+        if first_name is None:
+            first_name = data[0].get('name')
+
+        if _parse_version is None:
+            # No semver support: keep the legacy assumption that the first
+            # tag returned is the newest.
+            best_name = data[0].get('name')
+            break
+
+        for tag in data:
+            tag_name = tag.get('name')
+            if not tag_name:
+                continue
+            try:
+                parsed = _parse_version(tag_name.lstrip('vV'))
+            except _InvalidVersion:
+                continue
+            if best_parsed is None or parsed > best_parsed:
+                best_parsed, best_name = parsed, tag_name
+
+        # Early exit: once we have seen a tag at or above the pinned version,
+        # later pages cannot change the up-to-date verdict.
+        if best_parsed is not None and current_parsed is not None and best_parsed >= current_parsed:
+            break
+        url = next_url
+
+    if best_name:
+        log_debug(f"Latest tag for {owner}/{repo}: {best_name}")
+        return best_name
+    if first_name:
+        # Nothing parsed as a version (non-PEP440 tag scheme): fall back to
+        # the first tag returned, matching the no-`packaging` behaviour.
+        log_debug(f"No parseable tags for {owner}/{repo}, falling back to first tag: {first_name}")
+        return first_name
     log_debug(f"No tags found or data is not a list for {owner}/{repo}.")
     return None
 
 
-def get_latest_commit_sha(owner: str, repo: str, branch_name: str) -> Optional[str]:
+async def get_latest_commit_sha(session: httpx.AsyncClient, owner: str, repo: str, branch_name: str) -> Optional[str]:
     """
     Get the latest commit SHA for a specific branch. Tries common default branches if the provided one fails.
     """
@@ -212,19 +534,19 @@ def get_latest_commit_sha(owner: str, repo: str, branch_name: str) -> Optional[s
         branches_to_try.append("main")
     elif branch_name.lower() == "main" and "master" not in branches_to_try:
         branches_to_try.append("master")
-    
+
     for branch in branches_to_try:
         url = f"https://api.github.com/repos/{owner}/{repo}/branches/{branch}"
         log_debug(f"Fetching latest commit SHA for {owner}/{repo} on branch '{branch}' from: {url}")
-        data = make_github_request(url)
-        
+        data = await make_github_request(session, url)
+
         if data and isinstance(data, dict) and 'commit' in data and isinstance(data['commit'], dict) and 'sha' in data['commit']:
             sha = data['commit']['sha']
             short_sha = sha[:7] # Standard short SHA
             log_debug(f"Latest commit SHA for {owner}/{repo} on branch '{branch}': {short_sha} (full: {sha})")
             return short_sha
         log_debug(f"Could not get commit SHA for {owner}/{repo} on branch '{branch}'.")
-    
+
     log_debug(f"Failed to get commit SHA for {owner}/{repo} on any attempted branches: {branches_to_try}")
     return None
 
@@ -235,46 +557,51 @@ def determine_status(current_version: str, latest_version: Optional[str], is_tra
     """
     if has_error or latest_version is None:
         return "🚨 Error Checking"
-    
+
     if is_tracking_branch:
         # For branches, we can't easily say "up to date" without comparing SHAs,
         # but 'current' is the branch name, 'latest' is the SHA.
         # We'll just mark it as tracking.
         return "ℹ️ Tracks Branch"
-    
+
     # Normalize versions for comparison (e.g., remove 'v' prefix)
     norm_current = current_version.lstrip('vV')
     norm_latest = latest_version.lstrip('vV')
 
     if norm_current == norm_latest:
         return "✅ Up to Date"
-    
-    # Basic semantic version check (not perfect but good enough for many cases)
-    try:
-        from packaging.version import parse as parse_version
-        if parse_version(norm_current) >= parse_version(norm_latest):
-            return "✅ Up to Date" # Current is newer or same (e.g. pre-release)
-    except ImportError:
-        log_debug("`packaging` library not found. Falling back to simple string comparison for versions.")
-    except Exception as e:
-        log_debug(f"Error comparing versions '{norm_current}' and '{norm_latest}' with packaging.version: {e}")
 
+    # Basic semantic version check (not perfect but good enough for many cases).
+    # Only reached when the cheap string-identity check above fails.
+    if _parse_version is not None:
+        try:
+            if _parse_version(norm_current) >= _parse_version(norm_latest):
+                return "✅ Up to Date" # Current is newer or same (e.g. pre-release)
+        except _InvalidVersion as e:
+            log_debug(f"Error comparing versions '{norm_current}' and '{norm_latest}' with packaging.version: {e}")
+    else:
+        log_debug("`packaging` library not found. Falling back to simple string comparison for versions.")
 
     return "⚠️ Update Available"
 
 
-def check_dependency_version(dependency_config: Dict[str, str]) -> Dict[str, Any]:
+async def check_dependency_version(dependency_config: Dict[str, str], session: httpx.AsyncClient) -> Dict[str, Any]:
     """
     Check the version status of a single dependency.
     """
     name = dependency_config['name']
     repo_url = dependency_config['url']
     current_version = dependency_config['current']
-    
-    print(f"Checking {name} ({repo_url})...")
-    
-    owner, repo_name = parse_github_url(repo_url)
-    
+
+    _log(f"Checking {name} ({repo_url})...")
+
+    # Prefer the (owner, repo) resolved at import time; fall back to parsing
+    # for entries supplied at runtime.
+    owner = dependency_config.get('_owner')
+    repo_name = dependency_config.get('_repo')
+    if not owner or not repo_name:
+        owner, repo_name = parse_github_url(repo_url)
+
     if not owner or not repo_name:
         return {
             "name": name,
@@ -284,33 +611,40 @@ def check_dependency_version(dependency_config: Dict[str, str]) -> Dict[str, Any
             "status": "🚨 Error Checking",
             "notes": "Could not parse GitHub URL"
         }
-    
-    is_tracking_branch = current_version.lower() in ['master', 'main', 'develop', 'dev', 'mainline'] # Add more if needed
+
+    is_tracking_branch = current_version.lower() in TRACKING_BRANCH_NAMES
     latest_version: Optional[str] = None
     notes = ""
     has_error = False
 
     if is_tracking_branch:
-        latest_version = get_latest_commit_sha(owner, repo_name, current_version)
+        latest_version = await get_latest_commit_sha(session, owner, repo_name, current_version)
         notes = f"Tracking '{current_version}' branch."
         if latest_version is None:
             notes += " Could not fetch latest commit."
             has_error = True
     else:
-        # Try /releases/latest first
-        latest_version = get_latest_release(owner, repo_name)
-        
-        if latest_version is None:
-            log_debug(f"No latest release found for {name}, trying latest tag...")
-            # Fallback to /tags
-            latest_version = get_latest_tag(owner, repo_name)
-            if latest_version:
-                notes = "Latest version from tags (no formal release found)."
-            else:
-                notes = "Could not fetch latest release or tag."
-                has_error = True
-        else:
+        # Fire the release and tag lookups concurrently rather than waiting
+        # for /releases/latest to miss before falling back to /tags. Costs one
+        # extra request for repos with releases, but halves latency for repos
+        # without them; the response cache absorbs the extra call on warm runs.
+        release, tag = await asyncio.gather(
+            get_latest_release(session, owner, repo_name),
+            get_latest_tag(session, owner, repo_name, current_version),
+            return_exceptions=True
+        )
+        if isinstance(release, RateLimitError) or isinstance(tag, RateLimitError):
+            raise release if isinstance(release, RateLimitError) else tag
+        if isinstance(release, str):
+            latest_version = release
             notes = "Latest version from releases."
+        elif isinstance(tag, str):
+            log_debug(f"No latest release found for {name}, using latest tag...")
+            latest_version = tag
+            notes = "Latest version from tags (no formal release found)."
+        else:
+            notes = "Could not fetch latest release or tag."
+            has_error = True
 
     if latest_version is None and not has_error: # Should be caught by has_error logic above
         latest_version = "Unknown"
@@ -319,7 +653,7 @@ def check_dependency_version(dependency_config: Dict[str, str]) -> Dict[str, Any
 
 
     status = determine_status(current_version, latest_version, is_tracking_branch, has_error)
-    
+
     result = {
         "name": name,
         "url": repo_url,
@@ -329,10 +663,207 @@ def check_dependency_version(dependency_config: Dict[str, str]) -> Dict[str, Any
     }
     if notes: # Add notes only if they are non-empty
         result["notes"] = notes.strip()
-    
+
     return result
 
 
+# Repos per GraphQL request. One aliased sub-query per repo adds nodes to
+# the query cost, so very large dependency lists are paged in batches
+# rather than risking the per-query node limit.
+GRAPHQL_BATCH_SIZE = 25
+
+# Pause between GraphQL batches once the reported remaining quota drops
+# below this.
+GRAPHQL_RATE_LIMIT_FLOOR = 10
+
+
+def build_graphql_batch_query(parsed_deps: List[Tuple[Dict[str, str], str, str]]) -> str:
+    """
+    Build a single GraphQL query with one aliased sub-query per repository,
+    asking for the latest release, the newest tag and the default branch HEAD
+    in one shot. A rateLimit block rides along so batching can throttle
+    itself without extra requests.
+    """
+    sub_queries = ['rateLimit { cost remaining resetAt }']
+    for index, (_dep_config, owner, repo) in enumerate(parsed_deps):
+        sub_queries.append(
+            f'repo{index}: repository(owner: "{owner}", name: "{repo}") {{\n'
+            '  latestRelease { tagName }\n'
+            '  refs(refPrefix: "refs/tags/", first: 1, orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) { nodes { name } }\n'
+            '  defaultBranchRef { target { oid } }\n'
+            '}'
+        )
+    return "query {\n" + "\n".join(sub_queries) + "\n}"
+
+
+async def _pause_if_graphql_quota_low(rate_limit: Optional[Dict[str, Any]]):
+    """Sleep until resetAt if the GraphQL quota reported inline is nearly gone."""
+    if not rate_limit:
+        return
+    log_debug(f"GraphQL rate limit: {rate_limit}")
+    remaining = rate_limit.get('remaining')
+    reset_at = rate_limit.get('resetAt')
+    if remaining is None or remaining >= GRAPHQL_RATE_LIMIT_FLOOR or not reset_at:
+        return
+    try:
+        wait_seconds = max(0.0, datetime.fromisoformat(reset_at).timestamp() - time.time())
+    except ValueError:
+        return
+    if wait_seconds > MAX_RATE_LIMIT_WAIT_SECONDS:
+        raise RateLimitError(
+            f"GraphQL quota nearly exhausted ({remaining} left); resets in {wait_seconds:.0f}s."
+        )
+    if wait_seconds > 0:
+        _log(f"⏳ GraphQL quota low ({remaining} left). Sleeping {wait_seconds:.0f}s until reset...")
+        await asyncio.sleep(wait_seconds)
+
+
+def result_from_graphql_repo(dependency_config: Dict[str, str], repo_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert one aliased repository block from the GraphQL response into the
+    same result dict shape produced by check_dependency_version.
+    """
+    name = dependency_config['name']
+    repo_url = dependency_config['url']
+    current_version = dependency_config['current']
+
+    is_tracking_branch = current_version.lower() in TRACKING_BRANCH_NAMES
+    latest_version: Optional[str] = None
+    notes = ""
+    has_error = False
+
+    if not repo_data:
+        notes = "Repository not found in GraphQL response."
+        has_error = True
+    elif is_tracking_branch:
+        branch_ref = repo_data.get('defaultBranchRef') or {}
+        oid = (branch_ref.get('target') or {}).get('oid')
+        notes = f"Tracking '{current_version}' branch."
+        if oid:
+            latest_version = oid[:7] # Standard short SHA
+        else:
+            notes += " Could not fetch latest commit."
+            has_error = True
+    else:
+        release_tag = (repo_data.get('latestRelease') or {}).get('tagName')
+        tag_nodes = (repo_data.get('refs') or {}).get('nodes') or []
+        if release_tag:
+            latest_version = release_tag
+            notes = "Latest version from releases."
+        elif tag_nodes and tag_nodes[0].get('name'):
+            latest_version = tag_nodes[0]['name']
+            notes = "Latest version from tags (no formal release found)."
+        else:
+            notes = "Could not fetch latest release or tag."
+            has_error = True
+
+    status = determine_status(current_version, latest_version, is_tracking_branch, has_error)
+
+    result = {
+        "name": name,
+        "url": repo_url,
+        "current": current_version,
+        "latest": latest_version if latest_version is not None else "Unknown",
+        "status": status
+    }
+    if notes:
+        result["notes"] = notes.strip()
+    return result
+
+
+async def fetch_all_via_graphql(dependencies: List[Dict[str, str]], session: httpx.AsyncClient, github_token: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Check all dependencies with a single GraphQL request instead of up to
+    three REST round-trips per dependency. Returns None if the batch query
+    fails so the caller can fall back to the per-dependency REST path.
+    """
+    parsed_deps: List[Tuple[Dict[str, str], str, str]] = []
+    unparsable_results: Dict[int, Dict[str, Any]] = {}
+    for index, dep_config in enumerate(dependencies):
+        owner = dep_config.get('_owner')
+        repo = dep_config.get('_repo')
+        if not owner or not repo:
+            owner, repo = parse_github_url(dep_config['url'])
+        if owner and repo:
+            parsed_deps.append((dep_config, owner, repo))
+        else:
+            unparsable_results[index] = {
+                "name": dep_config['name'],
+                "url": dep_config['url'],
+                "current": dep_config['current'],
+                "latest": "Unknown",
+                "status": "🚨 Error Checking",
+                "notes": "Could not parse GitHub URL"
+            }
+
+    headers = {
+        'User-Agent': 'Dependency-Version-Checker/1.0 (Python Script)',
+        'Authorization': f'bearer {github_token}'
+    }
+
+    # Page the aliased sub-queries in batches so large dependency lists stay
+    # under the per-query node limit; the inline rateLimit block lets us
+    # throttle between batches without extra requests.
+    repo_blocks: List[Dict[str, Any]] = []
+    for start in range(0, len(parsed_deps), GRAPHQL_BATCH_SIZE):
+        batch = parsed_deps[start:start + GRAPHQL_BATCH_SIZE]
+        query = build_graphql_batch_query(batch)
+        log_debug(f"GraphQL batch query for {len(batch)} repositories (offset {start}):\n{query}")
+        try:
+            response = await session.post("https://api.github.com/graphql", json={"query": query}, headers=headers)
+            body = response.content
+            if response.status_code != 200:
+                _log(f"WARN: GraphQL endpoint returned HTTP {response.status_code}. Falling back to REST. Body: {body[:200]!r}")
+                return None
+            payload = _json_loads(body)
+        except (httpx.HTTPError, ValueError) as e:
+            _log(f"WARN: GraphQL batch request failed ({type(e).__name__}: {e}). Falling back to REST.")
+            return None
+
+        data = payload.get('data')
+        if not data:
+            _log(f"WARN: GraphQL response carried no data (errors: {payload.get('errors')}). Falling back to REST.")
+            return None
+
+        repo_blocks.extend(data.get(f'repo{i}') for i in range(len(batch)))
+        if start + GRAPHQL_BATCH_SIZE < len(parsed_deps):
+            await _pause_if_graphql_quota_low(data.get('rateLimit'))
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(dependencies)
+    for index, prebuilt in unparsable_results.items():
+        results[index] = prebuilt
+    graphql_index = 0
+    for index, dep_config in enumerate(dependencies):
+        if results[index] is not None:
+            continue
+        results[index] = result_from_graphql_repo(dep_config, repo_blocks[graphql_index])
+        graphql_index += 1
+    return [r for r in results if r is not None]
+
+
+async def check_all_dependencies(dependencies: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Check all dependencies concurrently over one shared HTTP session.
+    With a GITHUB_TOKEN available the whole run collapses into a single
+    GraphQL batch request; otherwise (or if the batch fails) each dependency
+    is checked via the REST API. Results keep the input order.
+    """
+    github_token = os.environ.get('GITHUB_TOKEN')
+    # HTTP/2 multiplexes every concurrent request over a single TCP+TLS
+    # connection, so the run pays exactly one handshake to api.github.com.
+    async with httpx.AsyncClient(http2=True, timeout=REQUEST_TIMEOUT) as session:
+        await warm_up_rate_limit(session)
+        if github_token:
+            results = await fetch_all_via_graphql(dependencies, session, github_token)
+            if results is not None:
+                for result in results:
+                    _log(f"Checked {result['name']} via GraphQL batch.")
+                return results
+        return list(await asyncio.gather(
+            *(check_dependency_version(dep_config, session) for dep_config in dependencies)
+        ))
+
+
 def main():
     """Main function to check all dependencies and generate data.json."""
     start_time_iso = datetime.now(timezone.utc).isoformat()
@@ -340,17 +871,25 @@ def main():
     print(f"📅 Started at: {start_time_iso}")
     if DEBUG_MODE:
         print("--- DEBUG MODE ENABLED ---")
-    
-    all_results: List[Dict[str, Any]] = []
-    
+    if not CACHE_ENABLED:
+        print("--- RESPONSE CACHE DISABLED (--no-cache) ---")
+
+    load_response_cache()
+
     dependencies_to_check = IOS_DEPENDENCIES # Later, this could be extended or loaded from a file
-    
-    for dep_config in dependencies_to_check:
-        # Optional: Add a small delay between requests if still hitting secondary rate limits
-        # time.sleep(0.5) # 0.5 second delay
-        result = check_dependency_version(dep_config)
-        all_results.append(result)
-        
+
+    try:
+        all_results: List[Dict[str, Any]] = asyncio.run(check_all_dependencies(dependencies_to_check))
+    except RateLimitError as e:
+        flush_log()
+        save_response_cache()
+        print(f"\n❌ ERROR: {e}")
+        sys.exit(1)
+
+    flush_log()
+    save_response_cache()
+
+    for result in all_results:
         status_symbol = result['status'].split()[0] # Get the emoji
         print(f"  {status_symbol} {result['name']}: {result['current']} → {result['latest']}")
         if 'notes' in result and result['notes']:
@@ -360,28 +899,34 @@ def main():
         "last_updated_utc": start_time_iso, # Store the start time
         "dependencies": all_results
     }
-    
+
     # Ensure docs directory exists
     docs_dir = 'docs'
     os.makedirs(docs_dir, exist_ok=True)
-    
+
     output_file_path = os.path.join(docs_dir, 'data.json')
     try:
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # Write to a temp file and os.replace so a killed run can never leave
+        # a truncated data.json behind for the docs pipeline to choke on.
+        tmp_file_path = output_file_path + '.tmp'
+        with open(tmp_file_path, 'wb') as f:
+            f.write(_json_dumps_indented(output_data))
+        os.replace(tmp_file_path, output_file_path)
         print(f"\n✅ Version check complete!")
         print(f"📄 Results written to {output_file_path}")
     except IOError as e:
         print(f"\n❌ ERROR: Could not write results to {output_file_path}: {e}")
         sys.exit(1)
-    
-    # Summary statistics
+
+    # Summary statistics: one pass over the results, bucketed by the emoji
+    # prefix, instead of four separate list comprehensions.
     total = len(all_results)
-    up_to_date = len([r for r in all_results if "✅" in r['status']])
-    updates_available = len([r for r in all_results if "⚠️" in r['status']])
-    tracking_branch = len([r for r in all_results if "ℹ️" in r['status']])
-    errors = len([r for r in all_results if "🚨" in r['status']])
-    
+    status_counts = Counter(r['status'].split(None, 1)[0] for r in all_results)
+    up_to_date = status_counts['✅']
+    updates_available = status_counts['⚠️']
+    tracking_branch = status_counts['ℹ️']
+    errors = status_counts['🚨']
+
     print(f"\n📊 Summary:")
     print(f"  Total dependencies: {total}")
     print(f"  Up to date: {up_to_date}")
@@ -393,4 +938,4 @@ def main():
         print("\n⚠️ Some dependencies encountered errors. Please check the logs.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -10,13 +10,46 @@ and checks their latest available versions.
 import json
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Any
-from urllib.request import Request, urlopen, build_opener, HTTPCookieProcessor
-from urllib.error import HTTPError, URLError
+import atexit
+from dataclasses import dataclass
+import functools
 import re
+import threading
+import time
 import base64 # For decoding GitHub file content
-import http.cookiejar # For GitHub raw file access with token
+from urllib.parse import quote
+
+# orjson (Rust-backed) parses GitHub payloads several times faster than the
+# stdlib and takes bytes directly, so responses skip the intermediate UTF-8
+# decode. Fall back to stdlib json so the script still runs without it.
+try:
+    import orjson
+
+    def _json_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data: Any) -> Any:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
 
 # --- Configuration ---
 PRIMARY_PROJECT_REPO_URL = "https://github.com/CongL3/AnniversaryTracker"
@@ -31,18 +64,238 @@ PACKAGE_RESOLVED_PATH = "AnniversaryTracker.xcodeproj/project.xcworkspace/xcshar
 DEBUG_MODE = os.environ.get('DEBUG_CHECK_VERSIONS', 'False').lower() == 'true'
 REQUEST_TIMEOUT = 20
 
+# Upper bound on concurrent dependency lookups, overridable via
+# CHECK_CONCURRENCY. The default of 8 keeps the fan-out well inside
+# GitHub's secondary (abuse) rate limits while still collapsing wall time
+# to ~max(latency) for typical SPM dependency counts.
+try:
+    MAX_WORKERS = max(1, int(os.environ.get('CHECK_CONCURRENCY', '8')))
+except ValueError:
+    MAX_WORKERS = 8
+
+# Attempts per request before giving up. Transient server errors are retried
+# with backoff in make_api_request itself so both transports (httpx and the
+# requests fallback) get identical behaviour.
+MAX_REQUEST_ATTEMPTS = 3
+
+# One pooled session for the whole run: keep-alive reuses the TCP+TLS
+# connection to api.github.com across all API calls instead of paying a
+# fresh handshake per request. When httpx (with the h2 extra) is installed
+# the workload — many small GETs to the same host — multiplexes over a
+# single HTTP/2 connection, so the threaded workers share one TLS session
+# with no HTTP/1.1 head-of-line blocking. Otherwise a requests.Session
+# provides HTTP/1.1 pooling. Both expose the same .get/.post/.head surface
+# and response attributes this script uses; transient-5xx retries live in
+# make_api_request so they apply to whichever transport is active.
+_USER_AGENT = 'Project-Dependency-Checker/1.0'
+try:
+    import httpx
+
+    SESSION = httpx.Client(
+        http2=True,
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_connections=MAX_WORKERS, max_keepalive_connections=MAX_WORKERS),
+        headers={'User-Agent': _USER_AGENT},
+        follow_redirects=True,
+    )
+    _TRANSPORT_ERRORS = (httpx.HTTPError,)
+    _TIMEOUT_ERRORS = (httpx.TimeoutException,)
+except ImportError:
+    httpx = None
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    SESSION = requests.Session()
+    SESSION.mount('https://', HTTPAdapter(
+        pool_connections=MAX_WORKERS,
+        pool_maxsize=MAX_WORKERS * 2,
+    ))
+    SESSION.headers['User-Agent'] = _USER_AGENT
+    _TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+
+# Optional typed decoding of Package.resolved: msgspec populates C-level
+# structs straight from the bytes, skipping both the intermediate dict tree
+# and the chained .get() walking. parse_package_resolved falls back to
+# dict-walking when msgspec is not installed.
+try:
+    import msgspec
+
+    class _PinState(msgspec.Struct):
+        version: Optional[str] = None
+        branch: Optional[str] = None
+        revision: Optional[str] = None
+
+    class _PinV1(msgspec.Struct):
+        package: Optional[str] = None
+        identity: Optional[str] = None
+        repositoryURL: Optional[str] = None
+        state: Optional[_PinState] = None
+
+    class _PinV2(msgspec.Struct):
+        identity: Optional[str] = None
+        location: Optional[str] = None
+        state: Optional[_PinState] = None
+
+    class _ObjectV1(msgspec.Struct):
+        pins: List[_PinV1] = []
+
+    class _ResolvedFile(msgspec.Struct):
+        version: int = 1
+        pins: List[_PinV2] = []          # v2+ layout
+        object: Optional[_ObjectV1] = None  # v1 layout
+
+    _resolved_decoder = msgspec.json.Decoder(_ResolvedFile)
+except ImportError:
+    msgspec = None
+
+# Optional semantic-version comparison, imported once here instead of inside
+# determine_status (which paid an import lookup per call). Normalization and
+# parse live in one lru_cached helper so identical tags — common when many
+# packages sit on the same version — cost a single dict hit on repeat.
+try:
+    from packaging.version import parse as _packaging_parse
+
+    @functools.lru_cache(maxsize=2048)
+    def _norm_parse(version_str: str):
+        """Strip a leading 'v'/'V' tag prefix and parse; cached per string."""
+        return _packaging_parse(_strip_v_prefix(version_str))
+except ImportError:
+    _norm_parse = None
+
+def _strip_v_prefix(version_str: str) -> str:
+    """
+    Drop a single leading 'v'/'V' from a tag. A slice-and-test beats
+    lstrip('vV'), which scans for an arbitrary run of prefix characters
+    (and would happily mangle 'vv1.0' into '1.0').
+    """
+    return version_str[1:] if version_str[:1] in ('v', 'V') else version_str
+
+
+def _repo_basename(url: str) -> str:
+    """Last path segment of a repo URL, minus a '.git' suffix. URLs here are
+    always '/'-separated, so rpartition replaces the os.path.basename frame
+    (which routes through posixpath.split)."""
+    return url.removesuffix('.git').rpartition('/')[2]
+
+
+# --- GitHub token pool ---
+# GITHUB_TOKENS (comma-separated) multiplies rate-limit headroom: each token
+# carries its own hourly budget and requests rotate through the pool
+# round-robin. A plain GITHUB_TOKEN gives a pool of one, which behaves
+# exactly as before. Tokens that hit their rate limit are benched until
+# their advertised reset and skipped by the rotation meanwhile.
+_TOKENS = [t.strip()
+           for t in os.environ.get('GITHUB_TOKENS', os.environ.get('GITHUB_TOKEN', '')).split(',')
+           if t.strip()]
+_token_lock = threading.Lock()
+_token_index = 0
+_token_benched_until: Dict[str, float] = {}
+
+
+def _next_token() -> Optional[str]:
+    """Round-robin over the token pool, skipping benched (rate-limited) tokens."""
+    global _token_index
+    if not _TOKENS:
+        return None
+    now = time.time()
+    with _token_lock:
+        for _ in range(len(_TOKENS)):
+            token = _TOKENS[_token_index % len(_TOKENS)]
+            _token_index += 1
+            if _token_benched_until.get(token, 0.0) <= now:
+                return token
+        # Every token is benched; hand one out anyway rather than stalling —
+        # the server will answer 403 and the caller reports it as before.
+        return _TOKENS[_token_index % len(_TOKENS)]
+
+
+def _bench_token(token: Optional[str], reset_header: Optional[str]):
+    """Take a rate-limited token out of rotation until its reset epoch."""
+    if not token:
+        return
+    try:
+        benched_until = float(reset_header) if reset_header else time.time() + 60.0
+    except ValueError:
+        benched_until = time.time() + 60.0
+    with _token_lock:
+        _token_benched_until[token] = benched_until
+    log_debug(f"Token ...{token[-4:]} benched until {benched_until:.0f} (rate limited).")
+
+
+# On-disk cache of API responses keyed by URL. GitHub honours If-None-Match
+# with a cheap 304 that returns no body and does not count against the
+# primary rate limit, so warm runs re-download almost nothing.
+API_CACHE_PATH = os.path.join('.cache', 'gh_api.json')
+
+# How long a "repo has no GitHub Releases" marker stays valid before the
+# repo is probed again (repos do occasionally start publishing releases).
+NO_RELEASES_TTL_SECONDS = 7 * 24 * 3600
+
+# Loaded once at startup, persisted at the end of main().
+# Entries: {url: {"etag": ..., "last_modified": ..., "body": <decoded JSON>, "fetched_at": ...}}
+_api_cache: Dict[str, Dict[str, Any]] = {}
+_api_cache_loaded = False
+
+
+def load_api_cache():
+    """Load the persisted API response cache (missing/corrupt file = cold run)."""
+    global _api_cache, _api_cache_loaded
+    try:
+        with open(API_CACHE_PATH, 'rb') as f:
+            _api_cache = _json_loads(f.read())
+        log_debug(f"Loaded {len(_api_cache)} cached API responses from {API_CACHE_PATH}")
+    except FileNotFoundError:
+        log_debug(f"No API cache at {API_CACHE_PATH} (cold run).")
+    except (ValueError, OSError) as e:
+        print(f"WARN: Could not read API cache {API_CACHE_PATH}: {e}. Starting cold.")
+        _api_cache = {}
+    _api_cache_loaded = True
+
+
+def save_api_cache():
+    """Persist the API cache so the next run can send conditional requests."""
+    if not _api_cache_loaded:
+        # Never clobber a good cache with an empty dict if we bail out
+        # before load_api_cache() ran (e.g. config errors at startup).
+        return
+    try:
+        os.makedirs(os.path.dirname(API_CACHE_PATH), exist_ok=True)
+        tmp_path = API_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(_api_cache))
+        os.replace(tmp_path, API_CACHE_PATH)
+        log_debug(f"Persisted {len(_api_cache)} API responses to {API_CACHE_PATH}")
+    except OSError as e:
+        print(f"WARN: Could not write API cache {API_CACHE_PATH}: {e}")
+
+
+# Safety net: even if the script exits early (sys.exit in main, unhandled
+# error), whatever validators were collected this run still get persisted.
+atexit.register(save_api_cache)
+
 # --- Helper Functions ---
 
 def log_debug(message: str):
     if DEBUG_MODE:
         print(f"DEBUG: {message}")
 
+# Compiled once at import time; parse_github_url_to_owner_repo runs at least
+# once per dependency and the per-call pattern string paid the re-cache
+# lookup every time.
+_GH_URL_RE = re.compile(r'^(?:https?|git)://github\.com/([^/]+)/([^/]+)$')
+
+
+# lru_cached: main and the GraphQL prefetch both parse every dependency URL,
+# and the primary project URL is parsed more than once. Repeat calls
+# short-circuit to the cached tuple (debug logging only fires on a miss,
+# which keeps warm-path calls side-effect free).
+@functools.lru_cache(maxsize=None)
 def parse_github_url_to_owner_repo(url: str) -> Tuple[Optional[str], Optional[str]]:
     if not url:
         return None, None
     processed_url = url.removesuffix('.git').rstrip('/')
-    pattern = r'^(?:https?|git)://github\.com/([^/]+)/([^/]+)$'
-    match = re.match(pattern, processed_url)
+    match = _GH_URL_RE.match(processed_url)
     if match:
         owner, repo = match.group(1), match.group(2)
         log_debug(f"Parsed URL '{url}' -> Owner: '{owner}', Repo: '{repo}'")
@@ -50,148 +303,293 @@ def parse_github_url_to_owner_repo(url: str) -> Tuple[Optional[str], Optional[st
     log_debug(f"Failed to parse GitHub URL to owner/repo: '{url}'")
     return None, None
 
-def make_api_request(url: str, token: Optional[str] = None, is_raw_download: bool = False) -> Optional[Any]:
-    headers = {'User-Agent': 'Project-Dependency-Checker/1.0'}
+def make_api_request(url: str, token: Optional[str] = None, is_raw_download: bool = False,
+                     accept: Optional[str] = None) -> Optional[Any]:
+    if token is None:
+        token = _next_token()
+    headers = {}
     if token:
         headers['Authorization'] = f'token {token}'
-        log_debug(f"Using GITHUB_TOKEN for request to {url}")
+        log_debug(f"Using GitHub token for request to {url}")
     else:
-        log_debug(f"No GITHUB_TOKEN found for request to {url}. Rate limits/access may be restricted.")
+        log_debug(f"No GitHub token found for request to {url}. Rate limits/access may be restricted.")
 
-    if is_raw_download:
-        cookie_jar = http.cookiejar.CookieJar()
-        opener = build_opener(HTTPCookieProcessor(cookie_jar))
-        if token: opener.addheaders = [('Authorization', f'token {token}')]
-    else:
+    if accept:
+        headers['Accept'] = accept
+    elif not is_raw_download:
         headers['Accept'] = 'application/vnd.github.v3+json'
-        opener = build_opener()
+    # Raw downloads (Package.resolved) are cached too: raw.githubusercontent
+    # emits ETags, so the common CI run where the project did not change
+    # turns the file fetch into a bodyless 304. Raw bodies are stored as
+    # UTF-8 text since the cache file is JSON. An explicit Accept is part of
+    # the cache key — the same URL can answer with different representations.
+    cache_key = f"{accept} {url}" if accept else url
+    cached_entry = _api_cache.get(cache_key)
+    if cached_entry:
+        # Send both validators when we have them: some endpoints only
+        # emit one of ETag/Last-Modified and either is enough for a 304.
+        if cached_entry.get('etag'):
+            headers['If-None-Match'] = cached_entry['etag']
+        if cached_entry.get('last_modified'):
+            headers['If-Modified-Since'] = cached_entry['last_modified']
+        if 'If-None-Match' in headers or 'If-Modified-Since' in headers:
+            log_debug(f"Conditional request for {url} (ETag: {cached_entry.get('etag')}, Last-Modified: {cached_entry.get('last_modified')})")
 
-    opener.addheaders = list(headers.items())
     log_debug(f"Making GET request to: {url} with headers: {headers if DEBUG_MODE else '...'}")
 
     try:
-        request = Request(url)
-        with opener.open(request, timeout=REQUEST_TIMEOUT) as response:
-            log_debug(f"Response status {response.status} for {url}")
-            if response.status == 200:
-                content = response.read()
-                return content if is_raw_download else json.loads(content.decode('utf-8'))
-            else:
-                print(f"WARN: HTTP {response.status} for {url}. Body: {response.read().decode('utf-8', errors='ignore')[:200]}")
-                return None
-    except HTTPError as e:
-        error_body = ""
-        try: error_body = e.read().decode('utf-8', errors='ignore')
-        except Exception: pass
-        print(f"ERROR: HTTP Error {e.code} for {url}: {e.reason}. Response body: {error_body[:500]}")
-        if e.code == 403 and "rate limit exceeded" in error_body.lower(): print("ERROR: GitHub API rate limit exceeded.")
-        elif e.code == 401 and token: print("ERROR: GitHub Token might be invalid or lack permissions.")
+        response = None
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            # Transient server errors (and 429s) are worth retrying with
+            # backoff instead of failing the dependency for the whole run;
+            # honour Retry-After when the server sends one.
+            if response.status_code not in (429, 500, 502, 503, 504) or attempt == MAX_REQUEST_ATTEMPTS - 1:
+                break
+            try:
+                delay = float(response.headers.get('Retry-After', 0.5 * 2 ** attempt))
+            except ValueError:
+                delay = 0.5 * 2 ** attempt
+            log_debug(f"HTTP {response.status_code} for {url} (attempt {attempt + 1}/{MAX_REQUEST_ATTEMPTS}), retrying in {delay:.1f}s...")
+            time.sleep(delay)
+        log_debug(f"Response status {response.status_code} for {url}")
+        if response.status_code == 304 and cached_entry:
+            log_debug(f"304 Not Modified for {url}, reusing cached body.")
+            body = cached_entry['body']
+            return body.encode('utf-8') if is_raw_download else body
+        if response.status_code == 200:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if is_raw_download:
+                if etag or last_modified:
+                    try:
+                        _api_cache[cache_key] = {'etag': etag, 'last_modified': last_modified,
+                                           'body': response.content.decode('utf-8'),
+                                           'fetched_at': datetime.now(timezone.utc).isoformat()}
+                    except UnicodeDecodeError:
+                        pass  # binary file: serve it, just don't cache it
+                return response.content
+            body = _json_loads(response.content)
+            if etag or last_modified:
+                _api_cache[cache_key] = {'etag': etag, 'last_modified': last_modified, 'body': body,
+                                   'fetched_at': datetime.now(timezone.utc).isoformat()}
+            return body
+
+        error_body = response.text[:500]
+        print(f"ERROR: HTTP Error {response.status_code} for {url}. Response body: {error_body}")
+        if response.status_code == 403 and "rate limit exceeded" in error_body.lower():
+            print("ERROR: GitHub API rate limit exceeded.")
+            _bench_token(token, response.headers.get('X-RateLimit-Reset'))
+            alternate = _next_token()
+            if alternate and alternate != token and _token_benched_until.get(alternate, 0.0) <= time.time():
+                log_debug(f"Retrying {url} with another token from the pool.")
+                return make_api_request(url, alternate, is_raw_download, accept)
+        elif response.status_code == 401 and token: print("ERROR: GitHub Token might be invalid or lack permissions.")
         return None
-    except URLError as e: print(f"ERROR: URL Error for {url}: {e.reason}"); return None
-    except json.JSONDecodeError as e: print(f"ERROR: Failed to decode JSON from {url}: {e}"); return None
+    except _TIMEOUT_ERRORS: print(f"ERROR: Request to {url} timed out after {REQUEST_TIMEOUT}s"); return None
+    except _TRANSPORT_ERRORS as e: print(f"ERROR: Request error for {url}: {type(e).__name__} - {e}"); return None
+    except ValueError as e: print(f"ERROR: Failed to decode JSON from {url}: {e}"); return None
     except Exception as e: print(f"ERROR: Unexpected error for {url}: {type(e).__name__} - {e}"); return None
 
-def get_file_content_from_github(owner: str, repo: str, file_path: str, ref: Optional[str], token: Optional[str]) -> Optional[str]:
+def get_file_content_from_github(owner: str, repo: str, file_path: str, ref: Optional[str], token: Optional[str]) -> Optional[bytes]:
+    # Returns the raw file bytes: the JSON parsers downstream all take bytes
+    # directly, so decoding to str here would just be a wasted copy.
+    #
+    # Prefer the raw host: one round-trip returning the file bytes directly —
+    # no base64 decode, no JSON envelope, and no API rate-limit slot. The
+    # contents-API path below remains as a fallback (e.g. token-gated repos
+    # where raw access misbehaves).
+    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{ref or 'HEAD'}/{quote(file_path)}"
+    log_debug(f"Fetching file from raw host: {raw_url}")
+    raw_bytes = make_api_request(raw_url, token, is_raw_download=True)
+    if raw_bytes is not None:
+        return raw_bytes
+    log_debug(f"Raw host fetch failed for '{file_path}'; falling back to contents API.")
+
     ref_param = f"?ref={ref}" if ref else ""
     api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}{ref_param}"
     log_debug(f"Fetching file content from GitHub API: {api_url}")
-    
+
+    # Ask the contents API for the raw media type first: the body comes back
+    # directly — no JSON envelope and no base64 (which is 4/3 the bytes on
+    # the wire plus a decode step). The base64 JSON handling below is the
+    # last resort.
+    raw_bytes = make_api_request(api_url, token, is_raw_download=True,
+                                 accept='application/vnd.github.v3.raw')
+    if raw_bytes is not None:
+        return raw_bytes
+
     data = make_api_request(api_url, token)
     if data and 'content' in data and data.get('encoding') == 'base64':
-        try: return base64.b64decode(data['content']).decode('utf-8')
+        try: return base64.b64decode(data['content'])
         except Exception as e: print(f"ERROR: Failed to decode base64 content for '{file_path}': {e}"); return None
     elif data and 'download_url' in data and data['download_url']:
         log_debug(f"Trying download_url: {data['download_url']}")
         raw_bytes = make_api_request(data['download_url'], token, is_raw_download=True)
         if raw_bytes:
-            try: return raw_bytes.decode('utf-8')
-            except UnicodeDecodeError as e: print(f"ERROR: Failed to decode from download_url for '{file_path}': {e}"); return None
+            return raw_bytes
     elif data: print(f"ERROR: Unexpected response for file content of '{file_path}'. Keys: {list(data.keys())}")
     else: print(f"ERROR: Failed to fetch file content for '{file_path}' from {owner}/{repo} at ref '{ref}'.")
     return None
 
-def parse_package_resolved(content: str) -> List[Dict[str, Any]]:
+@dataclass(slots=True)
+class ResolvedDependency:
+    """One pin from Package.resolved.
+
+    Slotted: fixed attribute offsets instead of a per-instance dict, roughly
+    a third of the memory per pin — which is what matters if this ever runs
+    against a monorepo with hundreds of pins.
+    """
+    name: str
+    url: str
+    resolved_value: str  # version tag, branch name or revision SHA
+    pin_type: str        # "version", "branch", "revision", "unknown"
+
+
+def _iter_raw_pins_msgspec(content: bytes):
+    """Decode pins into typed structs; yields (identity, url, version, branch, revision)."""
+    resolved = _resolved_decoder.decode(content)
+    if resolved.version == 1:
+        for pin in (resolved.object.pins if resolved.object else []):
+            state = pin.state
+            yield (pin.package or pin.identity, pin.repositoryURL,
+                   state.version if state else None,
+                   state.branch if state else None,
+                   state.revision if state else None)
+    else:
+        for pin in resolved.pins:
+            state = pin.state
+            yield (pin.identity, pin.location,
+                   state.version if state else None,
+                   state.branch if state else None,
+                   state.revision if state else None)
+
+
+def _iter_raw_pins_dict(content: bytes):
+    """Dict-walking fallback; yields (identity, url, version, branch, revision)."""
+    data = _json_loads(content)
+    version_format = data.get("version", 1)
+
+    if version_format == 1:
+        pins = data.get("object", {}).get("pins", [])
+    elif version_format == 2:
+        pins = data.get("pins", [])
+    else:
+        print(f"ERROR: Unsupported Package.resolved version_format: {version_format}")
+        return
+
+    # Hot loop: bind the lookups once so each pin pays plain local-name
+    # loads instead of repeated attribute/global dispatch.
+    is_v1 = version_format == 1
+    for pin in pins:
+        pin_get = pin.get
+        state_get = pin_get("state", {}).get
+        if is_v1:
+            identity = pin_get("package", pin_get("identity"))
+            repo_url = pin_get("repositoryURL")
+        else:
+            identity = pin_get("identity")
+            repo_url = pin_get("location")
+        yield (identity, repo_url,
+               state_get("version"), state_get("branch"), state_get("revision"))
+
+
+def parse_package_resolved(content: bytes) -> List[ResolvedDependency]:
+    """Parse the Package.resolved bytes into dependency records.
+
+    Memoized on the content itself: identical bytes (retries, or the same
+    file checked across projects once this grows multi-project support)
+    cost a dict lookup instead of a re-parse. The tuple from the cached
+    worker is re-listed per call so callers can extend/partition freely;
+    the records themselves are shared and treated as read-only downstream.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return list(_parse_package_resolved_cached(bytes(content)))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_package_resolved_cached(content: bytes) -> Tuple[ResolvedDependency, ...]:
     dependencies = []
     try:
-        data = json.loads(content)
-        version_format = data.get("version", 1)
-
-        pins = []
-        if version_format == 1:
-            pins = data.get("object", {}).get("pins", [])
-        elif version_format == 2:
-            pins = data.get("pins", [])
-        else:
-            print(f"ERROR: Unsupported Package.resolved version_format: {version_format}")
-            return []
-
-        for pin in pins:
-            state = pin.get("state", {})
-            package_identity = ""
-            repo_url = ""
-
-            if version_format == 1:
-                package_identity = pin.get("package", pin.get("identity"))
-                repo_url = pin.get("repositoryURL")
-            elif version_format == 2:
-                package_identity = pin.get("identity")
-                repo_url = pin.get("location")
-            
+        raw_pins = _iter_raw_pins_msgspec(content) if msgspec else _iter_raw_pins_dict(content)
+
+        for package_identity, repo_url, version_tag, branch_name, revision_sha in raw_pins:
             if not package_identity and repo_url:
-                 package_identity = os.path.basename(repo_url.removesuffix(".git"))
+                 package_identity = _repo_basename(repo_url)
             if not package_identity or not repo_url:
-                log_debug(f"Skipping pin due to missing identity or URL: {pin}")
+                log_debug(f"Skipping pin due to missing identity or URL: {package_identity!r} / {repo_url!r}")
                 continue
 
-            resolved_version_tag = state.get("version")
-            resolved_branch_name = state.get("branch")
-            resolved_revision_sha = state.get("revision")
-
             current_pin_value: str
             # This new key clearly defines how the pin should be treated for version checking
             pin_type: str # "version", "branch", "revision", "unknown"
 
-            if resolved_version_tag:
-                current_pin_value = resolved_version_tag
+            if version_tag:
+                current_pin_value = version_tag
                 pin_type = "version"
-            elif resolved_branch_name:
-                current_pin_value = resolved_branch_name
+            elif branch_name:
+                current_pin_value = branch_name
                 pin_type = "branch"
-            elif resolved_revision_sha:
-                current_pin_value = resolved_revision_sha
+            elif revision_sha:
+                current_pin_value = revision_sha
                 pin_type = "revision"
             else:
-                log_debug(f"Pin for {package_identity} has no version, branch, or revision in state: {state}")
+                log_debug(f"Pin for {package_identity} has no version, branch, or revision in its state.")
                 current_pin_value = "unknown_state"
                 pin_type = "unknown"
-            
-            dependencies.append({
-                "name": package_identity,
-                "url": repo_url,
-                "resolved_value": current_pin_value, # Renamed from resolved_version for clarity
-                "pin_type": pin_type 
-            })
-            
-        log_debug(f"Parsed {len(dependencies)} dependencies from Package.resolved (format v{version_format})")
-        return dependencies
-    except json.JSONDecodeError as e: print(f"ERROR: Failed to parse Package.resolved JSON: {e}"); return []
-    except Exception as e: print(f"ERROR: Unexpected error parsing Package.resolved: {e}"); return []
 
-def get_latest_github_version(owner: str, repo: str, token: Optional[str]) -> Tuple[Optional[str], str, bool]:
-    release_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-    release_data = make_api_request(release_url, token)
-    if release_data and 'tag_name' in release_data:
-        log_debug(f"Latest release for {owner}/{repo}: {release_data['tag_name']}")
-        return release_data['tag_name'], "release", False
+            dependencies.append(ResolvedDependency(
+                name=package_identity,
+                url=repo_url,
+                resolved_value=current_pin_value,
+                pin_type=pin_type
+            ))
 
-    tags_url = f"https://api.github.com/repos/{owner}/{repo}/tags"
+        log_debug(f"Parsed {len(dependencies)} dependencies from Package.resolved")
+        return tuple(dependencies)
+    except ValueError as e: print(f"ERROR: Failed to parse Package.resolved JSON: {e}"); return () # Covers json/orjson/msgspec decode errors
+    except Exception as e: print(f"ERROR: Unexpected error parsing Package.resolved: {e}"); return ()
+
+def get_latest_github_version(owner: str, repo: str, token: Optional[str]) -> Tuple[Optional[str], str, bool]:
+    # Many SPM libraries never publish GitHub Releases, so /releases/latest
+    # is a guaranteed 404 on every run for them. The persistent cache keeps
+    # a '_no_releases' map of owner/repo -> epoch-marked; while the marker
+    # is fresh we go straight to /tags, halving the API calls for tag-only
+    # repos. Markers expire after NO_RELEASES_TTL_SECONDS so repos that
+    # start publishing releases are re-detected.
+    repo_key = f"{owner}/{repo}"
+    no_releases = _api_cache.setdefault('_no_releases', {})
+    marked_at = no_releases.get(repo_key)
+    skip_releases = marked_at is not None and time.time() - marked_at < NO_RELEASES_TTL_SECONDS
+
+    release_data = None
+    if skip_releases:
+        log_debug(f"{repo_key} marked release-less; skipping /releases/latest.")
+    else:
+        if marked_at is not None:
+            del no_releases[repo_key]  # stale marker: re-probe below
+        release_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+        release_data = make_api_request(release_url, token)
+        if release_data and 'tag_name' in release_data:
+            log_debug(f"Latest release for {owner}/{repo}: {release_data['tag_name']}")
+            return release_data['tag_name'], "release", False
+
+    # Only tags_data[0] is read below, so ask for a single tag: the default
+    # page of 30 entries (each with commit metadata) is ~30x more bytes to
+    # download and parse than we need.
+    tags_url = f"https://api.github.com/repos/{owner}/{repo}/tags?per_page=1"
     tags_data = make_api_request(tags_url, token)
     if tags_data and isinstance(tags_data, list) and len(tags_data) > 0:
         latest_tag_name = tags_data[0].get('name')
         if latest_tag_name:
             log_debug(f"Latest tag for {owner}/{repo}: {latest_tag_name}")
+            if not skip_releases and not release_data:
+                # Tags answered but releases did not: the repo is reachable
+                # and simply has no releases. Remember that.
+                no_releases[repo_key] = time.time()
             return latest_tag_name, "tag", False
-            
+
     log_debug(f"Could not find releases or tags for {owner}/{repo}")
     return None, "unknown", True
 
@@ -205,6 +603,64 @@ def get_latest_commit_sha(owner: str, repo: str, branch_name: str, token: Option
     log_debug(f"Could not get commit SHA for {owner}/{repo} on branch '{branch_name}'.")
     return None
 
+def fetch_versions_via_graphql(resolved_deps: List[ResolvedDependency], github_token: str) -> Optional[Dict[Tuple[str, str], Dict[str, Any]]]:
+    """
+    Fetch latest release, newest tag and (where relevant) branch HEAD for all
+    network-checked dependencies in one GraphQL POST instead of 2-3 REST
+    round-trips each. Returns {(owner, repo): repo_block} for the workers to
+    read from, or None if the batch failed (callers then fall back to REST).
+    """
+    # Deduplicated on (owner, repo): a repo referenced by several pins gets
+    # one aliased sub-query, keeping the query's node cost minimal. A branch
+    # ref is kept if any pin of that repo tracks one.
+    seen: Dict[Tuple[str, str], Optional[str]] = {}
+    for dep in resolved_deps:
+        if dep.pin_type not in ('version', 'branch'):
+            continue
+        owner, repo = parse_github_url_to_owner_repo(dep.url)
+        if not owner or not repo:
+            continue
+        branch = dep.resolved_value if dep.pin_type == 'branch' else None
+        if (owner, repo) not in seen or branch:
+            seen[(owner, repo)] = branch
+    specs: List[Tuple[str, str, Optional[str]]] = [(o, r, b) for (o, r), b in seen.items()]
+    if not specs:
+        return {}
+
+    sub_queries = []
+    for i, (owner, repo, branch) in enumerate(specs):
+        parts = [
+            'latestRelease { tagName }',
+            'refs(refPrefix: "refs/tags/", first: 1, orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) { nodes { name } }'
+        ]
+        if branch:
+            parts.append(f'ref(qualifiedName: "refs/heads/{branch}") {{ target {{ ... on Commit {{ oid }} }} }}')
+        sub_queries.append(f'd{i}: repository(owner: "{owner}", name: "{repo}") {{ ' + ' '.join(parts) + ' }')
+    query = 'query { ' + ' '.join(sub_queries) + ' }'
+    log_debug(f"GraphQL batch query for {len(specs)} repositories: {query}")
+
+    try:
+        response = SESSION.post(
+            'https://api.github.com/graphql',
+            json={'query': query},
+            headers={'Authorization': f'bearer {github_token}'},
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code != 200:
+            print(f"WARN: GraphQL endpoint returned HTTP {response.status_code}. Falling back to REST.")
+            return None
+        payload = _json_loads(response.content)
+    except (*_TRANSPORT_ERRORS, ValueError) as e:
+        print(f"WARN: GraphQL batch request failed ({type(e).__name__}: {e}). Falling back to REST.")
+        return None
+
+    data = payload.get('data')
+    if not data:
+        print(f"WARN: GraphQL response carried no data (errors: {payload.get('errors')}). Falling back to REST.")
+        return None
+    return {(owner, repo): data.get(f'd{i}') for i, (owner, repo, _branch) in enumerate(specs)}
+
+
 def determine_status(
     resolved_val: str, 
     latest_available_val: Optional[str], 
@@ -228,34 +684,74 @@ def determine_status(
 
     # If pin_type_val is "version" (or unknown and we assume version)
     if pin_type_val == "version" or pin_type_val == "unknown":
-        norm_resolved = resolved_val.lstrip('vV')
-        norm_latest = latest_available_val.lstrip('vV')
+        norm_resolved = _strip_v_prefix(resolved_val)
+        norm_latest = _strip_v_prefix(latest_available_val)
 
         if norm_resolved == norm_latest:
             return "✅ Up to Date"
-        
-        try:
-            from packaging.version import parse as parse_version
-            parsed_resolved = parse_version(norm_resolved)
-            parsed_latest = parse_version(norm_latest)
-
-            if parsed_resolved < parsed_latest:
-                return "⚠️ Update Available"
-            elif parsed_resolved > parsed_latest:
-                return "✅ Up to Date (Newer)" 
-            else: # Equal
-                return "✅ Up to Date"
-        except ImportError:
+
+        if _norm_parse is not None:
+            try:
+                parsed_resolved = _norm_parse(resolved_val)
+                parsed_latest = _norm_parse(latest_available_val)
+
+                if parsed_resolved < parsed_latest:
+                    return "⚠️ Update Available"
+                elif parsed_resolved > parsed_latest:
+                    return "✅ Up to Date (Newer)"
+                else: # Equal
+                    return "✅ Up to Date"
+            except Exception as e:
+                log_debug(f"Could not semantically compare '{norm_resolved}' and '{norm_latest}': {e}. Using string comparison.")
+                if norm_resolved < norm_latest: return "⚠️ Update Available"
+        else:
             log_debug("`packaging` library not found. Using string comparison.")
             if norm_resolved < norm_latest: return "⚠️ Update Available"
-        except Exception as e: 
-            log_debug(f"Could not semantically compare '{norm_resolved}' and '{norm_latest}': {e}. Using string comparison.")
-            if norm_resolved < norm_latest: return "⚠️ Update Available"
-        
+
         return "✅ Up to Date" # Default if comparisons lead here
 
     return "❓ Unknown Status" # Fallback for unhandled pin_type
 
+def warm_connection_pool():
+    """
+    Pay the DNS lookup and TLS handshake for both GitHub hosts once, up
+    front, so parallel workers all start against warmed keep-alive
+    connections (with TLS session tickets cached) instead of each first
+    request eating the cold-start cost.
+    """
+    for host in ('https://api.github.com/', 'https://raw.githubusercontent.com/'):
+        try:
+            SESSION.head(host, timeout=REQUEST_TIMEOUT)
+            log_debug(f"Warmed connection to {host}")
+        except _TRANSPORT_ERRORS as e:
+            log_debug(f"Connection warmup to {host} failed (ignored): {e}")
+
+
+def write_results_json(path: str, meta: Dict[str, Any], records) -> None:
+    """
+    Stream the output file one dependency record at a time instead of
+    serializing the whole document in one dumps() buffer, so peak memory
+    during emission stays constant regardless of how many dependencies the
+    project has. Records land one per line, which also keeps the automated
+    data.json commits diffable per dependency.
+
+    The document is staged in a sibling .tmp file and moved into place with
+    os.replace, so a run killed mid-write (CI cancellation) can never leave
+    a truncated artifact for the dashboard or downstream tooling.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(b'{\n')
+        for key, value in meta.items():
+            f.write(b'  ' + _json_dumps(key) + b': ' + _json_dumps(value) + b',\n')
+        f.write(b'  "dependencies": [')
+        for i, record in enumerate(records):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(_json_dumps(record))
+        f.write(b'\n  ]\n}\n')
+    os.replace(tmp_path, path)
+
+
 # --- Main Logic ---
 def main():
     start_time_iso = datetime.now(timezone.utc).isoformat()
@@ -266,15 +762,21 @@ def main():
     print(f"📄 Package.resolved Path: {PACKAGE_RESOLVED_PATH}")
     if DEBUG_MODE: print("--- DEBUG MODE ENABLED ---")
 
-    github_token = os.environ.get('GITHUB_TOKEN')
-    if not github_token: print("⚠️ WARNING: GITHUB_TOKEN not set. Rate limits low, private repos inaccessible.")
+    # Individual REST calls pass token=None and rotate through the pool;
+    # github_token here is only for the single GraphQL batch request.
+    github_token = _next_token()
+    if not _TOKENS: print("⚠️ WARNING: GITHUB_TOKEN/GITHUB_TOKENS not set. Rate limits low, private repos inaccessible.")
+    elif len(_TOKENS) > 1: log_debug(f"Rotating across {len(_TOKENS)} GitHub tokens.")
+
+    load_api_cache()
+    warm_connection_pool()
 
     project_owner, project_repo = parse_github_url_to_owner_repo(PRIMARY_PROJECT_REPO_URL)
     if not project_owner or not project_repo:
         print(f"❌ ERROR: Could not parse primary project URL: {PRIMARY_PROJECT_REPO_URL}"); sys.exit(1)
 
     package_resolved_content = get_file_content_from_github(
-        project_owner, project_repo, PACKAGE_RESOLVED_PATH, PRIMARY_PROJECT_REF, github_token
+        project_owner, project_repo, PACKAGE_RESOLVED_PATH, PRIMARY_PROJECT_REF, None
     )
     if not package_resolved_content:
         print(f"❌ ERROR: Failed to fetch Package.resolved from '{PRIMARY_PROJECT_REPO_URL}' at '{PACKAGE_RESOLVED_PATH}'."); sys.exit(1)
@@ -282,19 +784,28 @@ def main():
     resolved_deps = parse_package_resolved(package_resolved_content)
     if not resolved_deps:
         print("ℹ️ No dependencies found/parsed in Package.resolved.")
-        output_data = {"last_updated_utc": start_time_iso, "project_url": PRIMARY_PROJECT_REPO_URL, "dependencies": []}
         os.makedirs('docs', exist_ok=True)
-        with open('docs/data.json', 'w', encoding='utf-8') as f: json.dump(output_data, f, indent=2, ensure_ascii=False)
+        write_results_json('docs/data.json',
+                           {"last_updated_utc": start_time_iso, "project_url": PRIMARY_PROJECT_REPO_URL}, [])
+        save_api_cache()
         print("📄 Empty results written to docs/data.json"); sys.exit(0)
     
     print(f"\n🔎 Found {len(resolved_deps)} dependencies. Checking latest versions...")
 
-    final_results = []
-    for dep in resolved_deps: # dep now has 'resolved_value' and 'pin_type'
-        print(f"\nChecking: {dep['name']} ({dep['url']})")
-        print(f"  Resolved: {dep['resolved_value']} (Type: {dep['pin_type']})")
+    # With a token, one GraphQL POST answers every dependency up front; the
+    # REST helpers below only run for deps missing from the batch result.
+    graphql_data: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
+    if github_token:
+        graphql_data = fetch_versions_via_graphql(resolved_deps, github_token)
+        if graphql_data is not None:
+            print(f"⚡ Fetched {len(graphql_data)} repositories via one GraphQL batch request.")
 
-        dep_owner, dep_repo_name = parse_github_url_to_owner_repo(dep['url'])
+    def check_one(dep: ResolvedDependency) -> Tuple[Dict[str, Any], List[str]]:
+        """Check a single dependency; returns its record plus buffered log lines."""
+        lines = [f"\nChecking: {dep.name} ({dep.url})",
+                 f"  Resolved: {dep.resolved_value} (Type: {dep.pin_type})"]
+
+        dep_owner, dep_repo_name = parse_github_url_to_owner_repo(dep.url)
         latest_val: Optional[str] = None
         notes = ""
         has_error = False
@@ -303,65 +814,121 @@ def main():
             notes = "Could not parse dependency GitHub URL."
             has_error = True
         else:
-            if dep['pin_type'] == "version":
-                latest_val, version_type, err = get_latest_github_version(dep_owner, dep_repo_name, github_token)
-                has_error = err
-                if latest_val: notes = f"Latest from GitHub {version_type}."
-                elif not err: notes = "No releases or tags found on GitHub."; has_error = True # Treat as error if expecting version
-                else: notes = "Error fetching latest version from GitHub."
-            
-            elif dep['pin_type'] == "branch":
-                # dep['resolved_value'] is the branch name
-                latest_val = get_latest_commit_sha(dep_owner, dep_repo_name, dep['resolved_value'], github_token)
-                if latest_val: notes = f"Latest commit on branch '{dep['resolved_value']}'."
-                else: notes = f"Could not fetch latest commit for branch '{dep['resolved_value']}'."; has_error = True
-            
-            elif dep['pin_type'] == "revision":
-                # dep['resolved_value'] is a commit SHA.
-                latest_val = dep['resolved_value'] # The "latest" for a pinned SHA is itself.
+            graphql_block = graphql_data.get((dep_owner, dep_repo_name)) if graphql_data else None
+
+            if dep.pin_type == "version":
+                if graphql_block:
+                    release_tag = (graphql_block.get('latestRelease') or {}).get('tagName')
+                    tag_nodes = (graphql_block.get('refs') or {}).get('nodes') or []
+                    if release_tag:
+                        latest_val = release_tag; notes = "Latest from GitHub release."
+                    elif tag_nodes and tag_nodes[0].get('name'):
+                        latest_val = tag_nodes[0]['name']; notes = "Latest from GitHub tag."
+                    else:
+                        notes = "No releases or tags found on GitHub."; has_error = True
+                else:
+                    latest_val, version_type, err = get_latest_github_version(dep_owner, dep_repo_name, None)
+                    has_error = err
+                    if latest_val: notes = f"Latest from GitHub {version_type}."
+                    elif not err: notes = "No releases or tags found on GitHub."; has_error = True # Treat as error if expecting version
+                    else: notes = "Error fetching latest version from GitHub."
+
+            elif dep.pin_type == "branch":
+                # dep.resolved_value is the branch name
+                branch_oid = None
+                if graphql_block:
+                    branch_oid = ((graphql_block.get('ref') or {}).get('target') or {}).get('oid')
+                if branch_oid:
+                    latest_val = branch_oid[:7]
+                else:
+                    latest_val = get_latest_commit_sha(dep_owner, dep_repo_name, dep.resolved_value, None)
+                if latest_val: notes = f"Latest commit on branch '{dep.resolved_value}'."
+                else: notes = f"Could not fetch latest commit for branch '{dep.resolved_value}'."; has_error = True
+
+            elif dep.pin_type == "revision":
+                # dep.resolved_value is a commit SHA.
+                latest_val = dep.resolved_value # The "latest" for a pinned SHA is itself.
                 notes = "Pinned to specific commit."
-            
-            elif dep['pin_type'] == "unknown":
+
+            elif dep.pin_type == "unknown":
                 notes = "Unknown pin state in Package.resolved."
                 has_error = True
-            
-        status = determine_status(dep['resolved_value'], latest_val, dep['pin_type'], has_error)
-        
-        print(f"  Latest Available: {latest_val or 'Unknown'}")
-        print(f"  Status: {status}")
-        if notes: print(f"    Notes: {notes}")
-
-        final_results.append({
-            "name": dep['name'],
-            "source_url": dep['url'],
-            "resolved_value": dep['resolved_value'],
-            "pin_type": dep['pin_type'].capitalize(),
+
+        status = determine_status(dep.resolved_value, latest_val, dep.pin_type, has_error)
+
+        lines.append(f"  Latest Available: {latest_val or 'Unknown'}")
+        lines.append(f"  Status: {status}")
+        if notes: lines.append(f"    Notes: {notes}")
+
+        record = {
+            "name": dep.name,
+            "source_url": dep.url,
+            "resolved_value": dep.resolved_value,
+            "pin_type": dep.pin_type.capitalize(),
             "latest_available_version": latest_val or "Unknown",
             "status": status,
             "notes": notes.strip()
-        })
-
-    output_data = {
+        }
+        return record, lines
+
+    # Revision/unknown pins need no network call, so handle them inline and
+    # keep the executor slots for the deps that actually hit GitHub.
+    # final_results is indexed by the original Package.resolved position so
+    # the output order is unaffected by the partition.
+    net_deps = [(i, d) for i, d in enumerate(resolved_deps) if d.pin_type in ('version', 'branch')]
+    local_deps = [(i, d) for i, d in enumerate(resolved_deps) if d.pin_type not in ('version', 'branch')]
+
+    final_results: List[Optional[Dict[str, Any]]] = [None] * len(resolved_deps)
+
+    # Pipeline the stages instead of serializing them: the network lookups
+    # are submitted first so their round-trips are already in flight while
+    # the network-free pins are handled inline, then completions are
+    # drained as they arrive — a slow repo never holds up handling of the
+    # faster ones. Results land in their original slot via the index map,
+    # so docs/data.json keeps the Package.resolved order regardless.
+    executor = ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(net_deps))) if net_deps else None
+    try:
+        future_to_index = {executor.submit(check_one, dep): i for i, dep in net_deps} if executor else {}
+
+        for i, dep in local_deps:
+            record, lines = check_one(dep)
+            final_results[i] = record
+            print("\n".join(lines))
+
+        for future in as_completed(future_to_index):
+            record, lines = future.result()
+            final_results[future_to_index[future]] = record
+            print("\n".join(lines))
+    finally:
+        if executor:
+            executor.shutdown()
+
+    output_meta = {
         "last_updated_utc": start_time_iso,
         "project_url": PRIMARY_PROJECT_REPO_URL,
         "project_ref_used": PRIMARY_PROJECT_REF or "default branch",
         "package_resolved_path": PACKAGE_RESOLVED_PATH,
-        "dependencies": final_results
     }
-    
+
     os.makedirs('docs', exist_ok=True)
     output_file = 'docs/data.json' # Changed from project_deps_data.json to match TDD for index.html
     try:
-        with open(output_file, 'w', encoding='utf-8') as f: json.dump(output_data, f, indent=2, ensure_ascii=False)
+        write_results_json(output_file, output_meta, final_results)
         print(f"\n✅ Dependency check complete!")
         print(f"📄 Results written to {output_file}")
     except IOError as e: print(f"\n❌ ERROR: Could not write to {output_file}: {e}"); sys.exit(1)
 
+    save_api_cache()
+
     total = len(final_results)
-    up_to_date_count = len([r for r in final_results if "✅ Up to Date" in r['status']]) # More specific check
-    updates_available_count = len([r for r in final_results if "⚠️" in r['status']])
-    tracking_count = len([r for r in final_results if "ℹ️" in r['status']])
-    error_count = len([r for r in final_results if "🚨" in r['status']])
+    # One pass instead of four end-to-end comprehensions. Every status string
+    # starts with its category emoji, so the first code point is the bucket
+    # (⚠️/ℹ️ carry a trailing variation selector; [:1] ignores it).
+    status_counts = Counter(r['status'][:1] for r in final_results)
+    up_to_date_count = status_counts['✅']
+    updates_available_count = status_counts['⚠']
+    tracking_count = status_counts['ℹ']
+    error_count = status_counts['🚨']
 
     print(f"\n📊 Summary for dependencies from {PRIMARY_PROJECT_REPO_URL}:")
     print(f"  Total SPM dependencies: {total}")